@@ -1,13 +1,12 @@
 import argparse
-import cProfile
-import inspect
 import os
 import sys
+from functools import lru_cache, partial
+from importlib import import_module
 from importlib.metadata import entry_points
 
 import scrapy
 from scrapy.commands import BaseRunSpiderCommand, ScrapyCommand, ScrapyHelpFormatter
-from scrapy.crawler import CrawlerProcess
 from scrapy.exceptions import UsageError
 from scrapy.utils.misc import walk_modules
 from scrapy.utils.project import get_project_settings, inside_project
@@ -23,46 +22,107 @@ class ScrapyArgumentParser(argparse.ArgumentParser):
         return super()._parse_optional(arg_string)
 
 
+def _is_command_class(obj, module):
+    return (
+        isinstance(obj, type)
+        and issubclass(obj, ScrapyCommand)
+        and obj.__module__ == module.__name__
+        and obj not in (ScrapyCommand, BaseRunSpiderCommand)
+    )
+
+
 def _iter_command_classes(module_name):
     # TODO: add `name` attribute to commands and merge this function with
     # scrapy.utils.spider.iter_spider_classes
     for module in walk_modules(module_name):
+        # commands are usually defined in a class named Command, only look
+        # through the whole module when that is not the case
+        cmd = getattr(module, "Command", None)
+        if _is_command_class(cmd, module):
+            yield cmd
+            continue
         for obj in vars(module).values():
-            if (
-                inspect.isclass(obj)
-                and issubclass(obj, ScrapyCommand)
-                and obj.__module__ == module.__name__
-                and obj not in (ScrapyCommand, BaseRunSpiderCommand)
-            ):
+            if _is_command_class(obj, module):
                 yield obj
 
 
+# Built-in commands, mapped to whether they require a project and to their
+# short description. They are listed here so that running a command only
+# imports the module of that command, and listing commands imports none.
+_BUILTIN_COMMANDS = {
+    "bench": (False, "Run quick benchmark test"),
+    "check": (True, "Check spider contracts"),
+    "crawl": (True, "Run a spider"),
+    "edit": (True, "Edit spider"),
+    "fetch": (False, "Fetch a URL using the Scrapy downloader"),
+    "genspider": (False, "Generate new spider using pre-defined templates"),
+    "list": (True, "List available spiders"),
+    "parse": (True, "Parse URL (using its spider) and print the results"),
+    "runspider": (False, "Run a self-contained spider (without creating a project)"),
+    "settings": (False, "Get settings values"),
+    "shell": (False, "Interactive scraping console"),
+    "startproject": (False, "Create new project"),
+    "version": (False, "Print Scrapy version"),
+    "view": (False, "Open URL in browser, as seen by Scrapy"),
+}
+
+
+class _LazyCommand:
+    """Factory of a built-in command that imports its module when called."""
+
+    def __init__(self, module_name, short_desc):
+        self.module_name = module_name
+        self.short_desc = short_desc
+
+    def __call__(self):
+        return import_module(self.module_name).Command()
+
+
+def _get_builtin_commands(inproject):
+    return {
+        cmdname: _LazyCommand(f"scrapy.commands.{cmdname}", short_desc)
+        for cmdname, (requires_project, short_desc) in _BUILTIN_COMMANDS.items()
+        if inproject or not requires_project
+    }
+
+
+@lru_cache(maxsize=None)
 def _get_commands_from_module(module, inproject):
     d = {}
     for cmd in _iter_command_classes(module):
         if inproject or not cmd.requires_project:
             cmdname = cmd.__module__.split(".")[-1]
-            d[cmdname] = cmd()
+            d[cmdname] = cmd
     return d
 
 
-def _get_commands_from_entry_points(inproject, group="scrapy.commands"):
-    cmds = {}
+@lru_cache(maxsize=None)
+def _scrapy_entry_points(group="scrapy.commands"):
+    # scanning the metadata of every installed distribution is slow, so do it
+    # only once per process
     if sys.version_info >= (3, 10):
-        eps = entry_points(group=group)
-    else:
-        eps = entry_points().get(group, ())
-    for entry_point in eps:
-        obj = entry_point.load()
-        if inspect.isclass(obj):
-            cmds[entry_point.name] = obj()
-        else:
-            raise Exception(f"Invalid entry point {entry_point.name}")
-    return cmds
+        return tuple(entry_points(group=group))
+    return tuple(entry_points().get(group, ()))
+
+
+def _load_entry_point_command(entry_point):
+    obj = entry_point.load()
+    if isinstance(obj, type):
+        return obj()
+    raise Exception(f"Invalid entry point {entry_point.name}")
+
+
+def _get_commands_from_entry_points(inproject, group="scrapy.commands"):
+    return {
+        entry_point.name: partial(_load_entry_point_command, entry_point)
+        for entry_point in _scrapy_entry_points(group)
+    }
 
 
 def _get_commands_dict(settings, inproject):
-    cmds = _get_commands_from_module("scrapy.commands", inproject)
+    """Return a dict mapping command names to callables that take no
+    arguments and return a new instance of the corresponding command."""
+    cmds = _get_builtin_commands(inproject)
     cmds.update(_get_commands_from_entry_points(inproject))
     cmds_module = settings["COMMANDS_MODULE"]
     if cmds_module:
@@ -71,12 +131,10 @@ def _get_commands_dict(settings, inproject):
 
 
 def _pop_command_name(argv):
-    i = 0
-    for arg in argv[1:]:
-        if not arg.startswith("-"):
+    for i, arg in enumerate(argv[1:]):
+        if arg[:1] != "-":
             del argv[i]
             return arg
-        i += 1
 
 
 def _print_header(settings, inproject):
@@ -94,8 +152,12 @@ def _print_commands(settings, inproject):
     print("  scrapy <command> [options] [args]\n")
     print("Available commands:")
     cmds = _get_commands_dict(settings, inproject)
-    for cmdname, cmdclass in sorted(cmds.items()):
-        print(f"  {cmdname:<13} {cmdclass.short_desc()}")
+    for cmdname, cmdfactory in sorted(cmds.items()):
+        if isinstance(cmdfactory, _LazyCommand):
+            short_desc = cmdfactory.short_desc
+        else:
+            short_desc = cmdfactory().short_desc()
+        print(f"  {cmdname:<13} {short_desc}")
     if not inproject:
         print()
         print("  [ more ]      More commands available when run from project directory")
@@ -124,6 +186,10 @@ def execute(argv=None, settings=None):
     if argv is None:
         argv = sys.argv
 
+    if argv[1:] in (["--version"], ["-v"]):
+        print(f"Scrapy {scrapy.__version__}")
+        sys.exit(0)
+
     if settings is None:
         settings = get_project_settings()
         # set EDITOR from environment if available
@@ -135,16 +201,16 @@ def execute(argv=None, settings=None):
             settings["EDITOR"] = editor
 
     inproject = inside_project()
-    cmds = _get_commands_dict(settings, inproject)
     cmdname = _pop_command_name(argv)
     if not cmdname:
         _print_commands(settings, inproject)
         sys.exit(0)
-    elif cmdname not in cmds:
+    cmds = _get_commands_dict(settings, inproject)
+    if cmdname not in cmds:
         _print_unknown_command(settings, cmdname, inproject)
         sys.exit(2)
 
-    cmd = cmds[cmdname]
+    cmd = cmds[cmdname]()
     parser = ScrapyArgumentParser(
         formatter_class=ScrapyHelpFormatter,
         usage=f"scrapy {cmdname} {cmd.syntax()}",
@@ -157,7 +223,10 @@ def execute(argv=None, settings=None):
     opts, args = parser.parse_known_args(args=argv[1:])
     _run_print_help(parser, cmd.process_options, args, opts)
 
-    cmd.crawler_process = CrawlerProcess(settings)
+    if cmd.requires_crawler_process:
+        from scrapy.crawler import CrawlerProcess
+
+        cmd.crawler_process = CrawlerProcess(settings)
     _run_print_help(parser, _run_command, cmd, args, opts)
     sys.exit(cmd.exitcode)
 
@@ -170,11 +239,12 @@ def _run_command(cmd, args, opts):
 
 
 def _run_command_profiled(cmd, args, opts):
+    import cProfile
+
     if opts.profile:
         sys.stderr.write(f"scrapy: writing cProfile stats to {opts.profile!r}\n")
-    loc = locals()
     p = cProfile.Profile()
-    p.runctx("cmd.run(args, opts)", globals(), loc)
+    p.runcall(cmd.run, args, opts)
     if opts.profile:
         p.dump_stats(opts.profile)
 
@@ -4,18 +4,22 @@ Base class for Scrapy commands
 import argparse
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from twisted.python import failure
 
-from scrapy.crawler import CrawlerProcess
 from scrapy.exceptions import UsageError
 from scrapy.utils.conf import arglist_to_dict, feed_process_params_from_cli
 
+if TYPE_CHECKING:
+    from scrapy.crawler import CrawlerProcess
+
 
 class ScrapyCommand:
     requires_project = False
-    crawler_process: Optional[CrawlerProcess] = None
+    # whether scrapy.cmdline must set crawler_process before calling run()
+    requires_crawler_process = True
+    crawler_process: Optional["CrawlerProcess"] = None
 
     # default settings to be used for this command instead of global defaults
     default_settings: Dict[str, Any] = {}
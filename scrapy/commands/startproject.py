@@ -29,6 +29,7 @@ def _make_writable(path):
 
 class Command(ScrapyCommand):
     requires_project = False
+    requires_crawler_process = False
     default_settings = {"LOG_ENABLED": False, "SPIDER_LOADER_WARN_ONLY": True}
 
     def syntax(self):
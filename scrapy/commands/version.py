@@ -4,6 +4,7 @@ from scrapy.utils.versions import scrapy_components_versions
 
 
 class Command(ScrapyCommand):
+    requires_crawler_process = False
     default_settings = {"LOG_ENABLED": False, "SPIDER_LOADER_WARN_ONLY": True}
 
     def syntax(self):
@@ -1,36 +1,57 @@
 """Some debugging functions for working with the Scrapy engine"""
 
-# used in global tests code
-from time import time  # noqa: F401
-from typing import TYPE_CHECKING, Any, List, Tuple
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
 
 if TYPE_CHECKING:
     from scrapy.core.engine import ExecutionEngine
 
 
-def get_engine_status(engine: "ExecutionEngine") -> List[Tuple[str, Any]]:
-    """Return a report of the current engine status"""
-    tests = [
-        "time()-engine.start_time",
-        "len(engine.downloader.active)",
-        "engine.scraper.is_idle()",
-        "engine.spider.name",
-        "engine.spider_is_idle()",
-        "engine.slot.closing",
-        "len(engine.slot.inprogress)",
+_ENGINE_STATUS_TESTS: List[Tuple[str, Callable[["ExecutionEngine"], Any]]] = [
+    ("time()-engine.start_time", lambda engine: time() - engine.start_time),
+    ("len(engine.downloader.active)", lambda engine: len(engine.downloader.active)),
+    ("engine.scraper.is_idle()", lambda engine: engine.scraper.is_idle()),
+    ("engine.spider.name", lambda engine: engine.spider.name),
+    ("engine.spider_is_idle()", lambda engine: engine.spider_is_idle()),
+    ("engine.slot.closing", lambda engine: engine.slot.closing),
+    ("len(engine.slot.inprogress)", lambda engine: len(engine.slot.inprogress)),
+    (
         "len(engine.slot.scheduler.dqs or [])",
+        lambda engine: len(engine.slot.scheduler.dqs or []),
+    ),
+    (
         "len(engine.slot.scheduler.mqs)",
+        lambda engine: len(engine.slot.scheduler.mqs),
+    ),
+    (
         "len(engine.scraper.slot.queue)",
+        lambda engine: len(engine.scraper.slot.queue),
+    ),
+    (
         "len(engine.scraper.slot.active)",
+        lambda engine: len(engine.scraper.slot.active),
+    ),
+    (
         "engine.scraper.slot.active_size",
+        lambda engine: engine.scraper.slot.active_size,
+    ),
+    (
         "engine.scraper.slot.itemproc_size",
+        lambda engine: engine.scraper.slot.itemproc_size,
+    ),
+    (
         "engine.scraper.slot.needs_backout()",
-    ]
+        lambda engine: engine.scraper.slot.needs_backout(),
+    ),
+]
+
 
+def get_engine_status(engine: "ExecutionEngine") -> List[Tuple[str, Any]]:
+    """Return a report of the current engine status"""
     checks: List[Tuple[str, Any]] = []
-    for test in tests:
+    for test, func in _ENGINE_STATUS_TESTS:
         try:
-            checks += [(test, eval(test))]
+            checks += [(test, func(engine))]
         except Exception as e:
             checks += [(test, f"{type(e).__name__} (exception)")]
 
@@ -39,12 +60,11 @@ def get_engine_status(engine: "ExecutionEngine") -> List[Tuple[str, Any]]:
 
 def format_engine_status(engine: "ExecutionEngine") -> str:
     checks = get_engine_status(engine)
-    s = "Execution engine status\n\n"
-    for test, result in checks:
-        s += f"{test:<47} : {result}\n"
-    s += "\n"
+    lines = ["Execution engine status", ""]
+    lines.extend(f"{test.ljust(47)} : {result}" for test, result in checks)
+    lines.extend(["", ""])
 
-    return s
+    return "\n".join(lines)
 
 
 def print_engine_status(engine: "ExecutionEngine") -> None:
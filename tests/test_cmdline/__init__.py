@@ -9,6 +9,7 @@ from io import StringIO
 from pathlib import Path
 from subprocess import PIPE, Popen
 
+import scrapy
 from scrapy.utils.test import get_testenv
 
 
@@ -35,6 +36,14 @@ class CmdlineTest(unittest.TestCase):
             "override",
         )
 
+    def test_version_option(self):
+        expected = f"Scrapy {scrapy.__version__}"
+        self.assertEqual(self._execute("--version"), expected)
+        self.assertEqual(self._execute("-v"), expected)
+
+    def test_help_option(self):
+        self.assertIn("Available commands:", self._execute("-h"))
+
     def test_profiling(self):
         path = Path(tempfile.mkdtemp())
         filename = path / "res.prof"
@@ -21,6 +21,7 @@ from pytest import mark
 from twisted.trial import unittest
 
 import scrapy
+from scrapy.cmdline import _BUILTIN_COMMANDS, _iter_command_classes
 from scrapy.commands import ScrapyCommand, ScrapyHelpFormatter, view
 from scrapy.commands.startproject import IGNORE
 from scrapy.settings import Settings
@@ -68,6 +69,15 @@ class CommandSettings(unittest.TestCase):
         )
 
 
+class BuiltinCommandsTest(unittest.TestCase):
+    def test_builtin_commands_in_sync(self):
+        expected = {
+            cmd.__module__.split(".")[-1]: (cmd.requires_project, cmd().short_desc())
+            for cmd in _iter_command_classes("scrapy.commands")
+        }
+        self.assertEqual(_BUILTIN_COMMANDS, expected)
+
+
 class ProjectTest(unittest.TestCase):
     project_name = "testproject"
 